@@ -134,6 +134,8 @@ class InteractiveConsoleInREPL(InteractiveConsole):
 @exposed(tool=True)
 class PythonREPL(VBoxContainer):
     __STREAMS_CAPTURE_INSTALLED = False
+    # Overwritten in `_enter_tree`, `None` means the node is not ready yet
+    stdout_stderr_capture = None
 
     def _enter_tree(self):
         self.__plugin_instantiated = False
@@ -194,7 +196,7 @@ class PythonREPL(VBoxContainer):
             self.output_box.pop()
 
     def _process(self, delta):
-        if not hasattr(self, "stdout_stderr_capture"):
+        if self.stdout_stderr_capture is None:
             return
         # Display new lines
         self.write(self.stdout_stderr_capture.read_buffer())
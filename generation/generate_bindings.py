@@ -105,6 +105,9 @@ class ClassInfo:
 
 TYPES = {t.gdapi_type: t for t in ALL_TYPES_EXCEPT_OBJECTS}
 
+# Compiled once given `_cook_type` runs on every argument&return type in api.json
+ENUM_TYPE_REGEX = re.compile(r"enum.(\w+)::(\w+)")
+
 
 # Basically provide enough to run the tests and the pong demo
 SAMPLE_CLASSES = {
@@ -354,7 +357,7 @@ def cook_data(data):
         except KeyError:
             if type_.startswith("enum."):
                 # typically somethin like ``enum.AnimationTree::AnimationProcessMode``
-                pcls, ecls = re.match(r"enum.(\w+)::(\w+)", type_).groups()
+                pcls, ecls = ENUM_TYPE_REGEX.match(type_).groups()
                 return TypeSpec(
                     gdapi_type=type_,
                     c_type="godot_int",
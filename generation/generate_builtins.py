@@ -123,7 +123,14 @@ ALL_TYPES = [
     ),
 ]
 C_NAME_TO_TYPE_SPEC = {s.c_type: s for s in ALL_TYPES}
+# Reverse iteration so that the first spec wins on duplicated py_type (str, int, bool, float)
+PY_TYPE_TO_SPEC = {s.py_type: s for s in reversed(ALL_TYPES)}
+# Compiled once given `_cook_type` parses every argument&return type declaration
+TYPE_PARSE_REGEX = re.compile(r"^(const\W+|)([a-zA-Z_0-9]+)(\W*\*|)$")
 BUILTINS_TYPES = [s for s in ALL_TYPES if s.is_builtin]
+# Precomputed once given `load_builtin_method_spec` tries those prefixes against
+# every function of gdnative_api.json (order matters: first match wins)
+BUILTINS_PREFIXES = [(f"{s.c_type}_", s) for s in BUILTINS_TYPES]
 
 
 TARGET_TO_TYPE_SPEC = {
@@ -187,8 +194,7 @@ env.filters["merge"] = lambda x, **kwargs: {**x, **kwargs}
 def load_builtin_method_spec(func: dict, gdapi: str) -> BuiltinMethodSpec:
     c_name = func["name"]
     assert c_name.startswith("godot_"), func
-    for builtin_type in BUILTINS_TYPES:
-        prefix = f"{builtin_type.c_type}_"
+    for prefix, builtin_type in BUILTINS_PREFIXES:
         if c_name.startswith(prefix):
             py_name = c_name[len(prefix) :]
             break
@@ -198,17 +204,15 @@ def load_builtin_method_spec(func: dict, gdapi: str) -> BuiltinMethodSpec:
 
     def _cook_type(raw_type):
         # Hack type detection, might need to be improved with api evolutions
-        match = re.match(r"^(const\W+|)([a-zA-Z_0-9]+)(\W*\*|)$", raw_type.strip())
+        match = TYPE_PARSE_REGEX.match(raw_type.strip())
         if not match:
             raise RuntimeError(f"Unsuported type `{raw_type}` in function `{c_name}`")
         is_const = bool(match.group(1))
         c_type = match.group(2)
         is_ptr = bool(match.group(3))
 
-        for type_spec in ALL_TYPES:
-            if c_type == type_spec.c_type:
-                break
-        else:
+        type_spec = C_NAME_TO_TYPE_SPEC.get(c_type)
+        if type_spec is None:
             raise RuntimeError(f"Unsuported type `{raw_type}` in function `{c_name}`")
 
         return is_const, is_ptr, type_spec
@@ -298,8 +302,8 @@ def generate_builtins(
     def _get_type_spec(py_type):
         assert isinstance(py_type, str)
         try:
-            return next(t for t in ALL_TYPES if t.py_type == py_type)
-        except StopIteration:
+            return PY_TYPE_TO_SPEC[py_type]
+        except KeyError:
             raise RuntimeError(f"Unknown type `{py_type}`")
 
     def _get_target_method_spec_factory(render_target):
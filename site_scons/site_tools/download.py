@@ -1,3 +1,4 @@
+from shutil import copyfileobj
 from SCons.Util import is_List
 from SCons.Action import Action
 from urllib.request import urlopen
@@ -11,7 +12,8 @@ def Download(env, target, url):
             target = [target]
         with urlopen(url) as infd:
             with open(target[0].abspath, "bw") as outfd:
-                outfd.write(infd.read())
+                # Stream by chunks, downloads can be heavy (e.g. CPython prebuild)
+                copyfileobj(infd, outfd)
 
     return env.Command(target, None, Action(_do_download, f"Download {url}"))
 